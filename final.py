@@ -3,173 +3,240 @@
 Tic-Tac-Toe (Human vs Unbeatable AI)
 ------------------------------------
 - Human plays 'X' (goes first by default).
-- AI plays 'O' and uses Minimax (with optional Alpha-Beta pruning) to be unbeatable.
+- AI plays 'O' and uses memoized Minimax (with an optional early cutoff) to be unbeatable.
 - Run: python tictactoe_ai.py
 - Toggle options at the top (HUMAN_FIRST, USE_ALPHA_BETA).
 """
 
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 import math
 
 # ====== Configuration ======
 HUMAN = 'X'
 AI = 'O'
-EMPTY = ' '
 HUMAN_FIRST = True          # Set False if you want the AI to start
-USE_ALPHA_BETA = True       # Minimax with alpha-beta pruning for speed
+USE_ALPHA_BETA = True       # Stop searching a node once a forced win/loss is found
 
 
 # ====== Game Utilities ======
-WIN_LINES = [
-    (0, 1, 2), (3, 4, 5), (6, 7, 8),    # rows
-    (0, 3, 6), (1, 4, 7), (2, 5, 8),    # cols
-    (0, 4, 8), (2, 4, 6)                # diagonals
+# The board is a pair of 9-bit bitboards (x, o), one per player.
+# Bit i is set when cell i (row-major, 0..8) holds that player's mark.
+FULL = 0x1FF
+WIN_MASKS = [
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # cols
+    0b100010001, 0b001010100                # diagonals
 ]
 
 
-def print_board(board: List[str]) -> None:
+def print_board(x: int, o: int) -> None:
     """Pretty-print the current board."""
-    rows = [board[i:i+3] for i in range(0, 9, 3)]
-    def cell(c): return c if c != EMPTY else '·'
+    def cell(i):
+        if x >> i & 1:
+            return HUMAN
+        if o >> i & 1:
+            return AI
+        return '·'
     print("\n  1   2   3")
-    for r, row in enumerate(rows, start=1):
-        print(f"{r} {cell(row[0])} | {cell(row[1])} | {cell(row[2])}")
-        if r < 3:
+    for r in range(3):
+        a, b, c = (cell(3 * r + k) for k in range(3))
+        print(f"{r + 1} {a} | {b} | {c}")
+        if r < 2:
             print("  ---+---+---")
     print()
 
 
-def winner(board: List[str]) -> Optional[str]:
+def winner(x: int, o: int) -> Optional[str]:
     """Return 'X' or 'O' if someone won, else None."""
-    for a, b, c in WIN_LINES:
-        if board[a] != EMPTY and board[a] == board[b] == board[c]:
-            return board[a]
+    for m in WIN_MASKS:
+        if x & m == m:
+            return HUMAN
+        if o & m == m:
+            return AI
     return None
 
 
-def available_moves(board: List[str]) -> List[int]:
-    return [i for i, v in enumerate(board) if v == EMPTY]
+def iter_moves(x: int, o: int) -> Iterator[int]:
+    """Yield each empty cell as a single-bit move."""
+    moves = ~(x | o) & FULL
+    while moves:
+        b = moves & -moves
+        moves ^= b
+        yield b
 
 
-def is_terminal(board: List[str]) -> bool:
-    return winner(board) is not None or not available_moves(board)
+def evaluate(x: int, o: int) -> Tuple[bool, int]:
+    """Return (game over, score for the AI) with a single scan of the win masks."""
+    for m in WIN_MASKS:
+        if x & m == m:
+            return True, -1  # human (X) won
+        if o & m == m:
+            return True, 1   # AI (O) won
+    return (x | o) == FULL, 0  # draw or still in play
 
 
-def score(board: List[str]) -> int:
-    w = winner(board)
-    if w == AI:
-        return 1
-    if w == HUMAN:
-        return -1
-    return 0  # draw
+# ====== Board Symmetries ======
+def _symmetry_tables() -> List[List[int]]:
+    """One 512-entry lookup table per rotation/reflection of the board."""
+    rot = [3 * (i % 3) + 2 - i // 3 for i in range(9)]    # cell i -> cell after 90° turn
+    flip = [3 * (i // 3) + 2 - i % 3 for i in range(9)]   # cell i -> cell after mirror
+    perms, p = [], list(range(9))
+    for _ in range(4):
+        perms += [p, [flip[c] for c in p]]
+        p = [rot[c] for c in p]
+    return [[sum(1 << p[i] for i in range(9) if m >> i & 1) for m in range(512)]
+            for p in perms]
 
 
-# ====== Minimax (with optional Alpha-Beta) ======
-def minimax(board: List[str],
-            maximizing: bool,
-            alpha: float = -math.inf,
-            beta: float = math.inf) -> Tuple[int, Optional[int]]:
-    if is_terminal(board):
-        return score(board), None
+SYM_TABLES = _symmetry_tables()
 
-    best_move = None
-    order = move_order(board)  # heuristic order
+
+def canonical(x: int, o: int) -> Tuple[int, int]:
+    """Return the smallest (x, o) among the board's 8 symmetric images."""
+    return min((t[x], t[o]) for t in SYM_TABLES)
+
+
+# ====== Minimax (with optional early cutoff) ======
+def minimax_value(x: int, o: int, maximizing: bool) -> int:
+    """Return the game value (AI's point of view) with perfect play from here."""
+    # Rotated/mirrored boards have the same value, so they share a cache entry.
+    return _minimax_value(*canonical(x, o), maximizing)
+
+
+# Scores are exact, so a search can stop as soon as it reaches the best
+# value the mover can get; this keeps every result safe to memoize.
+@lru_cache(maxsize=20000)
+def _minimax_cutoff(x: int, o: int, maximizing: bool) -> int:
+    done, value = evaluate(x, o)
+    if done:
+        return value
 
     if maximizing:
-        best_score = -math.inf
-        for m in order:
-            board[m] = AI
-            s, _ = minimax(board, False, alpha, beta)
-            board[m] = EMPTY
-            if s > best_score:
-                best_score, best_move = s, m
-            if USE_ALPHA_BETA:
-                alpha = max(alpha, best_score)
-                if beta <= alpha:
-                    break
-        return best_score, best_move
+        best_score = -1
+        for m in move_order(x, o):
+            best_score = max(best_score, minimax_value(x, o | m, False))
+            if best_score == 1:
+                break
     else:
-        best_score = math.inf
-        for m in order:
-            board[m] = HUMAN
-            s, _ = minimax(board, True, alpha, beta)
-            board[m] = EMPTY
-            if s < best_score:
-                best_score, best_move = s, m
-            if USE_ALPHA_BETA:
-                beta = min(beta, best_score)
-                if beta <= alpha:
-                    break
-        return best_score, best_move
-
-
-def move_order(board: List[str]) -> List[int]:
+        best_score = 1
+        for m in move_order(x, o):
+            best_score = min(best_score, minimax_value(x | m, o, True))
+            if best_score == -1:
+                break
+    return best_score
+
+
+@lru_cache(maxsize=20000)
+def _minimax_plain(x: int, o: int, maximizing: bool) -> int:
+    done, value = evaluate(x, o)
+    if done:
+        return value
+
+    if maximizing:
+        return max(minimax_value(x, o | m, False) for m in move_order(x, o))
+    return min(minimax_value(x | m, o, True) for m in move_order(x, o))
+
+
+# Pick the search once here rather than testing USE_ALPHA_BETA at every node.
+_minimax_value = _minimax_cutoff if USE_ALPHA_BETA else _minimax_plain
+
+
+# Center, corners, then edges.
+MOVE_ORDER = [1 << i for i in (4, 0, 2, 6, 8, 1, 3, 5, 7)]
+
+
+def move_order(x: int, o: int) -> Iterator[int]:
     """Heuristic move ordering: center, corners, then edges."""
-    center = [4] if board[4] == EMPTY else []
-    corners = [i for i in [0, 2, 6, 8] if board[i] == EMPTY]
-    edges = [i for i in [1, 3, 5, 7] if board[i] == EMPTY]
-    return center + corners + edges
+    taken = x | o
+    return (b for b in MOVE_ORDER if not taken & b)
+
+
+def search_ai_move(x: int, o: int) -> int:
+    """Return the best move bit for the AI by searching from (x, o)."""
+    best_score, best_move = -math.inf, None
+    for m in move_order(x, o):
+        s = minimax_value(x, o | m, False)
+        if s > best_score:
+            best_score, best_move = s, m
+    return best_move
+
+
+def _build_policy() -> Dict[Tuple[int, int], int]:
+    """Map every reachable AI-to-move position to its best move bit."""
+    policy = {}
+
+    def rec(x: int, o: int, maximizing: bool) -> None:
+        if evaluate(x, o)[0] or (maximizing and (x, o) in policy):
+            return
+        if maximizing:
+            policy[(x, o)] = search_ai_move(x, o)
+        for m in iter_moves(x, o):
+            if maximizing:
+                rec(x, o | m, False)
+            else:
+                rec(x | m, o, True)
+
+    rec(0, 0, not HUMAN_FIRST)
+    return policy
 
 
-def best_ai_move(board: List[str]) -> int:
-    _, move = minimax(board, maximizing=True)
-    return move
+# The whole game is solved once at import; each AI turn is a dict lookup.
+POLICY = _build_policy()
+
+
+def best_ai_move(x: int, o: int) -> int:
+    return POLICY[(x, o)].bit_length() - 1
 
 
 # ====== Input Handling ======
+# '11'..'33' -> board index; separators are stripped before the lookup.
+MOVE_TABLE = {f"{r}{c}": (r - 1) * 3 + (c - 1) for r in range(1, 4) for c in range(1, 4)}
+
+
 def parse_move(s: str) -> Optional[int]:
-    """Parse inputs like '1 3' or '23' into board index."""
-    s = s.strip().replace(',', ' ')
-    parts = [p for p in s.split() if p.isdigit()]
-    if len(parts) == 2:
-        r, c = int(parts[0]), int(parts[1])
-    elif len(s) == 2 and all(ch.isdigit() for ch in s):
-        r, c = int(s[0]), int(s[1])
-    else:
-        return None
-    if 1 <= r <= 3 and 1 <= c <= 3:
-        return (r - 1) * 3 + (c - 1)
-    return None
+    """Parse inputs like '1 3', '1,3' or '23' into board index."""
+    return MOVE_TABLE.get(''.join(s.replace(',', ' ').split()))
 
 
-def human_turn(board: List[str]) -> None:
+def human_turn(x: int, o: int) -> int:
+    """Read a move from the user and return the human's updated bitboard."""
     while True:
         raw = input("Your move (row col, e.g., '2 3'): ").strip()
         m = parse_move(raw)
-        if m is None or board[m] != EMPTY:
+        if m is None or (x | o) >> m & 1:
             print("Invalid move. Try again.")
             continue
-        board[m] = HUMAN
-        break
+        return x | 1 << m
 
 
 # ====== Game Flow ======
 def game_loop() -> None:
-    board = [EMPTY] * 9
+    x = o = 0
     turn_is_human = HUMAN_FIRST
 
     print("\nTic-Tac-Toe — Human (X) vs AI (O)")
     print("Enter your move as 'row col' (e.g., 1 3).")
-    print_board(board)
+    print_board(x, o)
 
     while True:
         if turn_is_human:
-            human_turn(board)
+            x = human_turn(x, o)
         else:
             print("AI is thinking...")
-            m = best_ai_move(board)
-            board[m] = AI
+            m = best_ai_move(x, o)
+            o |= 1 << m
             print(f"AI chose: row {(m // 3) + 1}, col {(m % 3) + 1}")
-        print_board(board)
+        print_board(x, o)
 
-        w = winner(board)
+        w = winner(x, o)
         if w == HUMAN:
             print("You win! (Nice job!)")
             break
         elif w == AI:
             print("AI wins. Better luck next time.")
             break
-        elif not available_moves(board):
+        elif (x | o) == FULL:
             print("It's a draw.")
             break
 
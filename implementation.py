@@ -1,9 +1,11 @@
 import sys
 
 try:
+    import numpy as np
     import pandas as pd
+    from scipy.sparse import coo_matrix
     from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
+    from sklearn.preprocessing import normalize
 except ModuleNotFoundError as e:
     print(f"Missing dependency: {e.name}")
     print("Install required packages with:")
@@ -31,27 +33,47 @@ movies = pd.DataFrame({
     ]
 })
 
+# Plain lookup tables so the recommenders skip DataFrame masking on every call
+titles = movies['title'].to_numpy()
+genres = movies['genres'].to_numpy()
+title_to_idx = {}
+for i, t in enumerate(titles):
+    title_to_idx.setdefault(t.lower(), i)  # first occurrence wins, like a mask + [0]
+movie_id_to_idx = dict(zip(movies['movie_id'], range(len(movies))))
+
+def top_k_indices(scores, k):
+    """Indices of the k highest scores, best first; ties go to the lower index.
+
+    Selection is O(N) with np.partition; only the k winners get sorted.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+    above = np.flatnonzero(scores > kth)
+    top = np.concatenate((above, np.flatnonzero(scores == kth)[:k - len(above)]))
+    return top[np.lexsort((top, -scores[top]))]
+
 # ----------------------
 # CONTENT-BASED FILTERING
 # ----------------------
-vectorizer = TfidfVectorizer()
+# Rows are L2-normalized, so cosine similarity is a plain (sparse) dot product
+# and similarities can be computed per query instead of as a dense N x N matrix.
+vectorizer = TfidfVectorizer(norm='l2', dtype=np.float32)  # float32 is plenty for ranking
 tfidf_matrix = vectorizer.fit_transform(movies['genres'])
-cosine_sim = cosine_similarity(tfidf_matrix, tfidf_matrix)
 
 def recommend_movies_content(movie_title, num_recommendations=3):
     """Return a list of recommended movies (title + genres) similar to movie_title.
 
     This function is case-insensitive and raises a clear error if the title is missing.
     """
-    matches = movies[movies['title'].str.lower() == movie_title.lower()]
-    if matches.empty:
+    idx = title_to_idx.get(movie_title.lower())
+    if idx is None:
         raise ValueError(f"Movie '{movie_title}' not found in the dataset.")
 
-    idx = matches.index[0]
-    sim_scores = list(enumerate(cosine_sim[idx]))
-    sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-    sim_scores = [s for s in sim_scores if s[0] != idx][:num_recommendations]
-    return movies.iloc[[s[0] for s in sim_scores]][['title', 'genres']].to_dict('records')
+    row = tfidf_matrix.dot(tfidf_matrix[idx].T).toarray().ravel()
+    row[idx] = -np.inf  # never recommend the movie itself
+    top = top_k_indices(row, min(num_recommendations, len(row) - 1))
+    return [{'title': titles[i], 'genres': genres[i]} for i in top]
 
 # ----------------------
 # COLLABORATIVE FILTERING (USER-ITEM MATRIX)
@@ -62,39 +84,42 @@ ratings = pd.DataFrame({
     'rating':  [5, 4, 4, 5, 3, 4, 5, 4]
 })
 
-user_item_matrix = ratings.pivot_table(index='user_id', columns='movie_id', values='rating').fillna(0)
-user_similarity = cosine_similarity(user_item_matrix)
+# Sparse user x movie matrix built straight from the rating triples; rows are
+# L2-normalized so a user's similarity to everyone else is one sparse product.
+# Repeat (user, movie) ratings are averaged first, as pivot_table did; coo_matrix
+# would otherwise add them up.
+rating_triples = ratings.groupby(['user_id', 'movie_id'], as_index=False)['rating'].mean()
+user_cat = pd.Categorical(rating_triples['user_id'])
+movie_cat = pd.Categorical(rating_triples['movie_id'])
+user_ids = user_cat.categories.to_numpy()
+movie_ids = movie_cat.categories.to_numpy()
+user_index = {u: i for i, u in enumerate(user_ids)}
+user_item_matrix = coo_matrix(
+    (rating_triples['rating'].to_numpy(dtype=np.float32), (user_cat.codes, movie_cat.codes)),
+    shape=(len(user_ids), len(movie_ids)),
+).tocsr()  # float32: averaged ratings can be fractional, so int8 would truncate
+user_vectors = normalize(user_item_matrix)
 
 def recommend_movies_collaborative(user_id, num_recommendations=3):
-    """Recommend movies for a user based on the most similar other user.
+    """Recommend movies for a user, weighted by how similar other users are.
 
-    Uses the user-item rating matrix. The function handles non-contiguous user IDs by
-    mapping user_id to the pivot table index with get_loc().
+    Each movie the user hasn't rated scores sum(similarity(user, other) * rating(other, movie))
+    over all other users, so the whole ranking is two sparse matrix-vector products.
+    The function handles non-contiguous user IDs by mapping user_id to its matrix row
+    through user_index.
     """
-    if user_id not in user_item_matrix.index:
+    if user_id not in user_index:
         raise ValueError(f"User id {user_id} not found in ratings data.")
 
-    user_idx = user_item_matrix.index.get_loc(user_id)
-    sim_scores = list(enumerate(user_similarity[user_idx]))
-    sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-
-    # find nearest neighbor (skip self)
-    neighbors = [i for i, s in sim_scores if i != user_idx]
-    if not neighbors:
-        return []
-
-    top_neighbor_idx = neighbors[0]
-    neighbor_user_id = user_item_matrix.index[top_neighbor_idx]
-
-    user_movies = set(ratings[ratings['user_id'] == user_id]['movie_id'])
-    neighbor_ratings = ratings[ratings['user_id'] == neighbor_user_id]
-
-    candidates = neighbor_ratings[~neighbor_ratings['movie_id'].isin(user_movies)]
-    if candidates.empty:
-        return []
+    user_idx = user_index[user_id]
+    user_similarity = user_vectors.dot(user_vectors[user_idx].T).toarray().ravel()
+    user_similarity[user_idx] = 0  # skip self
 
-    candidates = candidates.sort_values(by='rating', ascending=False).head(num_recommendations)
-    return movies[movies['movie_id'].isin(candidates['movie_id'])][['title', 'genres']].to_dict('records')
+    scores = user_item_matrix.T.dot(user_similarity)
+    scores[user_item_matrix[user_idx].indices] = -np.inf  # already rated
+    top = top_k_indices(scores, min(num_recommendations, np.count_nonzero(scores > 0)))
+    rows = [movie_id_to_idx[m] for m in movie_ids[top] if m in movie_id_to_idx]
+    return [{'title': titles[i], 'genres': genres[i]} for i in rows]
 
 # ----------------------
 # Example usage